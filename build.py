@@ -13,6 +13,7 @@ __all__ = [
     "get_dependencies",
     "build_manifest",
     "build_pyproject",
+    "write_if_changed",
     "collect_files",
     "setup"
 ]
@@ -209,44 +210,67 @@ def build_pyproject(
                     f'\n[project]\n{content}'
                 )
 
+def write_if_changed(path: str | pathlib.Path, content: str) -> bool:
+
+    if os.path.exists(path):
+        with codecs.open(path, 'r') as existing_file:
+            if existing_file.read() == content:
+                return False
+
+    with codecs.open(path, 'w') as new_file:
+        new_file.write(content)
+
+    return True
+
 def build_manifest(
         include: Iterable[str] = None, manifest: bool = None
 ) -> None:
 
-    if not os.path.exists("MANIFEST.in") or not manifest:
-        with codecs.open("MANIFEST.in", 'w') as include_file:
-            include_file.write("")
-
-    if os.path.exists("MANIFEST.in"):
+    if os.path.exists("MANIFEST.in") and manifest:
         with codecs.open("MANIFEST.in", 'r') as include_file:
             include_content = include_file.read()
 
-        with codecs.open("MANIFEST.in", 'a') as include_file:
-            for line in include:
-                if line not in include_content:
-                    include_file.write(f"include {line}\n")
+    else:
+        include_content = ""
 
-def collect_files(location: str | pathlib.Path, levels: int = None) -> list[str]:
+    write_if_changed(
+        "MANIFEST.in", include_content + "".join(
+            f"include {line}\n" for line in include
+            if line not in include_content
+        )
+    )
+
+def collect_files(
+        location: str | pathlib.Path,
+        levels: int = None,
+        excluded: Iterable[str] = None
+) -> list[str]:
 
     paths = []
 
-    if levels == 0:
-        return paths
+    if excluded is None:
+        excluded = ()
 
-    for name in os.listdir(location):
-        path = pathlib.Path(location) / pathlib.Path(name)
+    excluded = set(excluded)
 
-        if path.is_file():
-            paths.append(str(path))
+    directories = [(location, levels)]
 
-        elif path.is_dir():
-            paths.extend(
-                collect_files(
-                    str(path), levels=(
-                        levels - 1 if levels is not None else levels
-                    )
-                )
-            )
+    while directories:
+        directory, remaining = directories.pop()
+
+        if remaining == 0:
+            continue
+
+        if remaining is not None:
+            remaining -= 1
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    paths.append(entry.path)
+
+                elif entry.is_dir() and entry.name not in excluded:
+                    directories.append((entry.path, remaining))
 
     return paths
 
@@ -254,6 +278,7 @@ def setup(
         package: str | pathlib.Path, *,
         readme: str | bool | pathlib.Path = None,
         exclude: Iterable[str | pathlib.Path] = None,
+        prune: Iterable[str] = None,
         include: Iterable[str | pathlib.Path] = None,
         requirements: str | pathlib.Path = None,
         dev_requirements: str | pathlib.Path = None,
@@ -274,6 +299,9 @@ def setup(
     if exclude is None:
         exclude = ()
 
+    if prune is None:
+        prune = ("__pycache__",)
+
     if isinstance(readme, (str, pathlib.Path)):
         with codecs.open(str(readme), 'r') as desc_file:
             long_description = desc_file.read()
@@ -297,7 +325,9 @@ def setup(
 
     for included in list(include):
         if included is not None and os.path.isdir(str(included)):
-            include += list(set(collect_files(location=included)))
+            include += list(
+                set(collect_files(location=included, excluded=prune))
+            )
 
     include = [str(pathlib.Path(path)) for path in include]
 
@@ -1,10 +1,21 @@
 # process.py
 
+import atexit
 import datetime as dt
+import sys
+import pickle
+import queue
 import threading
 import time
-from typing import Callable, Iterable, ParamSpec
-from dataclasses import dataclass
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, wait as wait_futures
+)
+from typing import (
+    Callable, Iterable, Literal, Mapping, NamedTuple, ParamSpec
+)
+from dataclasses import dataclass, field
 
 __all__ = [
     "Caller",
@@ -15,15 +26,400 @@ __all__ = [
     "await_completion",
     "ProcessTime",
     "find_caller",
-    "CallResult"
+    "find_callers_index",
+    "validate_callers",
+    "CallResult",
+    "thread_pool",
+    "process_pool",
+    "shutdown_pools"
 ]
 
+_counter = time.perf_counter_ns
+_counter_epoch = time.time_ns() - time.perf_counter_ns()
+
+_EMPTY_ARGS = ()
+_EMPTY_KWARGS = MappingProxyType({})
+_current_thread = threading.current_thread
+
+_P = ParamSpec("_P")
+
+_events_lock = threading.Lock()
+
+class _ElasticThreadPool(Executor):
+    """
+    A thread pool without a size limit, whose idle threads exit.
+
+    A new worker thread is only created when no idle one is available,
+    and a worker that stays idle for KEEP_ALIVE seconds exits,
+    so a burst of calls does not leave its threads parked afterwards.
+    """
+
+    KEEP_ALIVE = 0.5
+
+    def __init__(self, thread_name_prefix: str = "") -> None:
+        """
+        Defines the class attributes.
+
+        :param thread_name_prefix: The prefix of the worker thread names.
+        """
+
+        self.thread_name_prefix = thread_name_prefix
+
+        self._queue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._threads: set[threading.Thread] = set()
+        self._created = 0
+        self._shutdown = False
+
+    def submit[R](
+            self, fn: Callable[_P, R], /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> Future[R]:
+        """
+        Schedules the function to run in a worker thread.
+
+        :param fn: The function to call.
+        :param args: The positional arguments.
+        :param kwargs: The keyword arguments.
+
+        :return: The future of the call.
+        """
+
+        future = Future()
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    "cannot schedule new futures after shutdown"
+                )
+
+            self._queue.put((future, fn, args, kwargs))
+
+            if not self._idle.acquire(blocking=False):
+                self._created += 1
+
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}_{self._created}"
+                )
+
+                self._threads.add(thread)
+
+                thread.start()
+
+        return future
+
+    def _work(self) -> None:
+        """Runs the queued calls until the thread stays idle for too long."""
+
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.KEEP_ALIVE)
+
+                except queue.Empty:
+                    if self._idle.acquire(blocking=False):
+                        return
+
+                    continue
+
+                if item is None:
+                    return
+
+                future, fn, args, kwargs = item
+
+                del item
+
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(*args, **kwargs)
+
+                    except BaseException as error:
+                        future.set_exception(error)
+
+                    else:
+                        future.set_result(result)
+
+                del future, fn, args, kwargs
+
+                self._idle.release()
+
+        finally:
+            with self._lock:
+                self._threads.discard(_current_thread())
+
+    def shutdown(
+            self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None:
+        """
+        Stops the worker threads once the queued calls are done.
+
+        :param wait: The value to wait for the worker threads to exit.
+        :param cancel_futures: The value to cancel the calls not started.
+        """
+
+        with self._lock:
+            self._shutdown = True
+
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+
+                    except queue.Empty:
+                        break
+
+                    if item is not None:
+                        item[0].cancel()
+
+            threads = tuple(self._threads)
+
+            for _ in threads:
+                self._queue.put(None)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+class _LimitedThreadPool(Executor):
+    """
+    A view of a thread pool that runs at most max_workers calls at a time.
+
+    The remaining calls wait in a queue, and the threads that run
+    the calls take the next waiting call when they are done,
+    so no more than max_workers threads of the pool are used at once.
+    """
+
+    def __init__(self, executor: Executor, max_workers: int) -> None:
+        """
+        Defines the class attributes.
+
+        :param executor: The thread pool to run the calls in.
+        :param max_workers: The maximum amount of concurrent calls.
+        """
+
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.executor = executor
+        self.max_workers = max_workers
+
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._running = 0
+
+    def submit[R](
+            self, fn: Callable[_P, R], /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> Future[R]:
+        """
+        Schedules the function to run in the thread pool.
+
+        :param fn: The function to call.
+        :param args: The positional arguments.
+        :param kwargs: The keyword arguments.
+
+        :return: The future of the call.
+        """
+
+        future = Future()
+
+        with self._lock:
+            if self._running >= self.max_workers:
+                self._pending.append((future, fn, args, kwargs))
+
+                return future
+
+            self._running += 1
+
+        self.executor.submit(self._work, future, fn, args, kwargs)
+
+        return future
+
+    def _work(
+            self,
+            future: Future,
+            fn: Callable[..., ...],
+            args: tuple,
+            kwargs: dict[str, ...]
+    ) -> None:
+        """
+        Runs the call, and then the waiting calls, in the current thread.
+
+        :param future: The future of the call.
+        :param fn: The function to call.
+        :param args: The positional arguments.
+        :param kwargs: The keyword arguments.
+        """
+
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+
+                except BaseException as error:
+                    future.set_exception(error)
+
+                else:
+                    future.set_result(result)
+
+            with self._lock:
+                if not self._pending:
+                    self._running -= 1
+
+                    return
+
+                future, fn, args, kwargs = self._pending.popleft()
+
+_thread_pool: _ElasticThreadPool | None = None
+_process_pools: dict[int | None, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+def thread_pool(max_workers: int = None) -> Executor:
+    """
+    Returns the shared thread pool that runs the callers.
+
+    By default, the pool only creates a new worker thread when no idle
+    one is available, so every submitted caller runs concurrently, while
+    threads are reused across calls instead of being created per call.
+    Worker threads that stay idle for half a second exit.
+
+    With max_workers, a new view of the shared pool is returned, that runs
+    at most that many calls at a time, while the remaining calls wait
+    in its queue. Each batch gets its own view, so nested batches
+    do not compete for the same limit.
+
+    :param max_workers: The maximum amount of concurrent calls.
+
+    :return: The thread pool object.
+    """
+
+    global _thread_pool
+
+    pool = _thread_pool
+
+    if pool is None:
+        with _pools_lock:
+            pool = _thread_pool
+
+            if pool is None:
+                pool = _thread_pool = _ElasticThreadPool(
+                    thread_name_prefix="Caller"
+                )
+
+    if max_workers is not None:
+        return _LimitedThreadPool(pool, max_workers)
+
+    return pool
+
+def _shutdown_thread_pool_at_exit() -> None:
+    """Lets the idle worker threads exit when the interpreter shuts down."""
+
+    pool = _thread_pool
+
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+# threading runs these hooks before joining the worker threads,
+# atexit only runs after, so idle workers may delay the exit by KEEP_ALIVE
+getattr(threading, "_register_atexit", atexit.register)(
+    _shutdown_thread_pool_at_exit
+)
+
+def process_pool(max_workers: int = None) -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool that runs CPU-bound callers.
+
+    The pool is created once, with a worker process per CPU by default,
+    so the cost of starting the processes is paid only on the first call.
+
+    With max_workers, a shared pool of that many processes is returned.
+    Only one such pool is kept, it is replaced when the size changes.
+
+    :param max_workers: The maximum amount of worker processes.
+
+    :return: The process pool object.
+    """
+
+    pool = _process_pools.get(max_workers)
+
+    replaced = ()
+
+    if pool is None:
+        with _pools_lock:
+            pool = _process_pools.get(max_workers)
+
+            if pool is None:
+                if max_workers is not None:
+                    replaced = [
+                        _process_pools.pop(size)
+                        for size in tuple(_process_pools)
+                        if size is not None
+                    ]
+
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+
+                _process_pools[max_workers] = pool
+
+    for previous in replaced:
+        previous.shutdown(wait=False)
+
+    return pool
+
+def shutdown_pools(wait: bool = True) -> None:
+    """
+    Shuts down the shared pools, they are created again when needed.
+
+    :param wait: The value to wait for the running calls to complete.
+    """
+
+    global _thread_pool
+
+    with _pools_lock:
+        pools = [*_process_pools.values()]
+
+        if _thread_pool is not None:
+            pools.append(_thread_pool)
+
+        _thread_pool = None
+        _process_pools.clear()
+
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
 @dataclass(slots=True, frozen=True)
 class ProcessTime:
     """A class to contain the info of a call to the results."""
 
-    start: dt.datetime
-    end: dt.datetime
+    start_ns: int
+    end_ns: int
+
+    _time: dt.timedelta | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def start(self) -> dt.datetime:
+        """
+        Returns the start time of the call.
+
+        :return: The call start time.
+        """
+
+        return dt.datetime.fromtimestamp(
+            (_counter_epoch + self.start_ns) / 1_000_000_000
+        )
+
+    @property
+    def end(self) -> dt.datetime:
+        """
+        Returns the end time of the call.
+
+        :return: The call end time.
+        """
+
+        return dt.datetime.fromtimestamp(
+            (_counter_epoch + self.end_ns) / 1_000_000_000
+        )
 
     @property
     def time(self) -> dt.timedelta:
@@ -33,48 +429,60 @@ class ProcessTime:
         :return: The call time.
         """
 
-        return self.end - self.start
+        if self._time is None:
+            object.__setattr__(
+                self, "_time",
+                dt.timedelta(microseconds=(self.end_ns - self.start_ns) / 1000)
+            )
 
-_P = ParamSpec("_P")
+        return self._time
 
-class CallResult[R]:
-    """A class to represent a container for the call result."""
+def _process_call[R](
+        target: Callable[_P, R], /, *args: _P.args, **kwargs: _P.kwargs
+) -> tuple[R, int, int]:
+    """
+    Calls the function inside a worker process and times the call.
 
-    __slots__ = ('_returns', '_thread', '_time')
+    :param target: The function to call.
+    :param args: The positional arguments.
+    :param kwargs: The keyword arguments.
 
-    # noinspection PyShadowingNames
-    def __init__(
-            self,
-            returns: R = None,
-            thread: threading.Thread = None,
-            time: ProcessTime = None,
-    ) -> None:
+    :return: The returned response with the start and end counters.
+    """
 
-        self._returns = returns
-        self._thread = thread
-        self._time = time
+    start = _counter()
 
-    @property
-    def returns(self) -> R:
+    returns = target(*args, **kwargs)
 
-        return self._returns
+    end = _counter()
 
-    @property
-    def thread(self) -> threading.Thread:
+    return returns, start, end
 
-        return self._thread
+class CallResult[R](NamedTuple):
+    """
+    A class to represent a container for the call result.
 
-    @property
-    def time(self) -> ProcessTime:
+    The result is a named tuple of (returns, thread, time), so results
+    compare equal by value, iterate and unpack like tuples, and can only
+    be hashed when the returned value is hashable.
 
-        return self._time
+    The thread is the worker that ran the call, it must not be joined.
+    """
+
+    returns: R = None
+    thread: threading.Thread | None = None
+    time: ProcessTime | None = None
 
 class Caller[R]:
     """A class to represent a function caller object."""
 
+    PENDING = 0
+    RUNNING = 1
+    COMPLETE = 2
+
     __slots__ = (
         "target", "identifier", "args", "kwargs",
-        "_thread", "_result", "complete", "called"
+        "_thread", "_future", "_result", "_error", "_done", "state"
     )
 
     def __init__(
@@ -94,15 +502,18 @@ class Caller[R]:
         """
 
         self.target = target
-        self.args = args or ()
-        self.kwargs = kwargs or {}
-        self.identifier = identifier or self.target
+        self.args = _EMPTY_ARGS if args is None else tuple(args)
+        self.kwargs = _EMPTY_KWARGS if kwargs is None else kwargs
+        self.identifier = target if identifier is None else identifier
+
+        self.state = self.PENDING
 
-        self.complete = False
-        self.called = False
+        self._done: threading.Event | None = None
 
         self._thread: threading.Thread | None = None
+        self._future: Future[CallResult[R]] | None = None
         self._result: CallResult[R] | None = None
+        self._error: BaseException | None = None
 
     def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> CallResult[R]:
         """
@@ -114,36 +525,113 @@ class Caller[R]:
         :return: The returned response.
         """
 
-        start = dt.datetime.now()
+        if args:
+            self.args = args
 
-        self.args = args or self.args
-        self.kwargs = kwargs or self.kwargs
+        if kwargs:
+            self.kwargs = kwargs
 
-        self.called = True
+        return self._run()
 
-        returns: R = self.target(*self.args, **self.kwargs)
+    def _run(self) -> CallResult[R]:
+        """
+        Calls the function with the saved arguments and saves the response.
 
-        self.complete = True
+        :return: The returned response.
+        """
 
-        end = dt.datetime.now()
+        start = _counter()
 
-        self._result = CallResult[R](
-            time=ProcessTime(start=start, end=end),
-            thread=self.thread, returns=returns
-        )
+        self.state = self.RUNNING
+
+        self._thread = thread = _current_thread()
+
+        self._result = None
+        self._error = None
+
+        try:
+            if self.kwargs:
+                returns: R = self.target(*self.args, **self.kwargs)
+
+            else:
+                returns: R = self.target(*self.args)
+
+            end = _counter()
+
+            self._result = CallResult(
+                time=ProcessTime(start_ns=start, end_ns=end),
+                thread=thread, returns=returns
+            )
+
+        except BaseException as error:
+            self._error = error
+
+            raise
+
+        finally:
+            self._complete()
 
         return self.result
 
+    def _execute(self) -> CallResult[R]:
+        """
+        Runs the call in a worker and reports the error it raises.
+
+        :return: The returned response.
+        """
+
+        try:
+            return self._run()
+
+        except BaseException as error:
+            _report_error(error, self._thread)
+
+            raise
+
+    @property
+    def called(self) -> bool:
+        """
+        Checks if the call has started.
+
+        :return: The value of starting the call.
+        """
+
+        return self.state >= self.RUNNING
+
+    @property
+    def complete(self) -> bool:
+        """
+        Checks if the call has completed, even if the function raised.
+
+        :return: The value of completing the call.
+        """
+
+        return self.state == self.COMPLETE
+
     @property
-    def thread(self) -> threading.Thread:
+    def thread(self) -> threading.Thread | None:
         """
         Returns the thread object.
 
+        The thread is None until the call starts running, and with the
+        shared pools it is a worker that runs other calls afterwards,
+        so it must not be joined. Use wait or future to await the call.
+
         :return: The thread of the caller.
         """
 
         return self._thread
 
+    @property
+    def future(self) -> Future[CallResult[R]]:
+        """
+        Returns the future object.
+
+        :return: The future of the caller.
+        """
+
+        return self._future
+
     @property
     def result(self) -> CallResult[R]:
         """
@@ -154,64 +642,289 @@ class Caller[R]:
 
         return self._result
 
-    def start(self) -> None:
-        """Starts the process."""
+    @property
+    def error(self) -> BaseException | None:
+        """
+        Returns the error raised by the call, if any.
 
-        self._thread = threading.Thread(target=self)
+        :return: The error of the caller.
+        """
+
+        return self._error
+
+    def run(self) -> None:
+        """
+        Runs the process in the current thread.
+
+        The outcome is kept in a completed future,
+        the same way as when the call runs in an executor.
+        """
 
-        self.thread.start()
+        self._future = Future()
+
+        try:
+            self._future.set_result(self._run())
+
+        except Exception as error:
+            self._future.set_exception(error)
+
+            _report_error(error, self._thread)
+
+    def start(self, executor: Executor = None) -> None:
+        """
+        Starts the process.
+
+        With a process pool, the target, args and kwargs are sent
+        to the worker process, so they must be picklable.
+        multi_threaded_defined_call validates the targets before starting.
+
+        :param executor: The executor to submit the call to.
+        """
+
+        if executor is None:
+            executor = thread_pool()
+
+        if isinstance(executor, ProcessPoolExecutor):
+            self._future = Future()
+
+            self.state = self.RUNNING
+
+            executor.submit(
+                _process_call, self.target, *self.args, **self.kwargs
+            ).add_done_callback(self._collect)
+
+        else:
+            self._future = executor.submit(self._execute)
+
+    def _collect(
+            self, future: Future[tuple[R, int, int]]
+    ) -> None:
+        """
+        Collects the response of a call that ran in a worker process.
+
+        :param future: The future of the call in the worker process.
+        """
+
+        try:
+            returns, start, end = future.result()
+
+        except BaseException as error:
+            self._result = None
+            self._error = error
+
+            self._complete()
+
+            self._future.set_exception(error)
+
+            _report_error(error, None)
+
+        else:
+            self._result = CallResult(
+                time=ProcessTime(start_ns=start, end_ns=end), returns=returns
+            )
+
+            self._complete()
+
+            self._future.set_result(self.result)
+
+    def _complete(self) -> None:
+        """Marks the call as complete and wakes up the waiting threads."""
+
+        self.state = self.COMPLETE
+
+        done = self._done
+
+        if done is not None:
+            done.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits for the call to complete.
+
+        :param timeout: The maximum time to wait, in seconds.
+
+        :return: True if the call completed, False on timeout.
+        """
+
+        if self.state == self.COMPLETE:
+            return True
+
+        done = self._done
+
+        if done is None:
+            with _events_lock:
+                done = self._done
+
+                if done is None:
+                    done = self._done = threading.Event()
+
+            # the call may have completed before the event existed
+            if self.state == self.COMPLETE:
+                return True
+
+        return done.wait(timeout)
 
     def reset(self) -> None:
         """Rests the values from the calls."""
 
-        self.called = False
-        self.complete = False
+        self.state = self.PENDING
+
+        done = self._done
+
+        if done is not None:
+            done.clear()
 
     def clean(self) -> None:
         """Cleans the caller."""
 
         self._thread = None
+        self._future = None
         self._result = None
+        self._error = None
 
-def find_caller(callers: Iterable[Caller], identifier: ...) -> Caller:
+def _report_error(
+        error: BaseException, thread: threading.Thread | None
+) -> None:
     """
-    Finds the caller object by its identifier
+    Reports an error raised by a call, the same way as in a thread.
 
-    :param callers: The results in which to search.
-    :param identifier: The identifier of the caller to return.
+    Like in a thread, when threading.excepthook raises,
+    sys.excepthook handles that error instead of propagating it.
 
-    :return: The matching caller object.
+    :param error: The error raised by the call.
+    :param thread: The thread that ran the call.
+    """
+
+    try:
+        threading.excepthook(
+            threading.ExceptHookArgs(
+                (type(error), error, error.__traceback__, thread)
+            )
+        )
+
+    except Exception:
+        sys.excepthook(*sys.exc_info())
+
+def _validate_picklable_targets(callers: Iterable[Caller]) -> None:
+    """
+    Validates that the targets can be sent to a worker process.
+
+    Each distinct target is pickled once, however many callers share it.
+
+    :param callers: The call objects for the functions.
     """
 
+    checked = set()
+
     for caller in callers:
-        if caller.identifier == identifier:
-            return caller
+        if id(caller.target) in checked:
+            continue
+
+        checked.add(id(caller.target))
+
+        try:
+            pickle.dumps(caller.target)
+
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(
+                f"The target of a process call must be picklable "
+                f"(a module level function, not a lambda or a closure), "
+                f"not: {caller.target!r}"
+            ) from error
 
-    raise ValueError(
+def _unknown_identifier_error(
+        identifier: ..., callers: Iterable[Caller]
+) -> ValueError:
+    """
+    Creates the error for an identifier that matches no caller object.
+
+    :param identifier: The identifier that was searched for.
+    :param callers: The caller objects that were searched.
+
+    :return: The error to raise.
+    """
+
+    identifiers = ", ".join(str(caller.identifier) for caller in callers)
+
+    return ValueError(
         f"Cannot find a caller object with the identifier: "
-        f"{identifier}. valid identifiers are: "
-        f"{', '.join(str(caller.identifier) for caller in callers)}"
+        f"{identifier}. valid identifiers are: {identifiers}"
     )
 
-def find_results(callers: Iterable[Caller], identifier: ...) -> Caller:
+def find_caller(
+        callers: Iterable[Caller],
+        identifier: ...,
+        index: dict[..., Caller] = None
+) -> Caller:
     """
     Finds the caller object by its identifier
 
     :param callers: The results in which to search.
     :param identifier: The identifier of the caller to return.
+    :param index: The prebuilt index of the callers by their identifiers.
 
     :return: The matching caller object.
     """
 
+    if index is not None:
+        try:
+            return index[identifier]
+
+        except (KeyError, TypeError):
+            pass
+
     for caller in callers:
         if caller.identifier == identifier:
             return caller
 
-    raise ValueError(
-        f"Cannot find a caller object with the identifier: "
-        f"{identifier}. valid identifiers are: "
-        f"{', '.join(str(caller.identifier) for caller in callers)}"
-    )
+    raise _unknown_identifier_error(identifier, callers)
+
+def find_callers_index(callers: Iterable[Caller]) -> dict[..., Caller]:
+    """
+    Builds an index of the caller objects by their identifiers.
+
+    When identifiers repeat, the first caller is kept,
+    the same one that find_caller returns. Unhashable identifiers
+    are left out, find_caller finds them with a linear scan.
+
+    :param callers: The caller objects to index.
+
+    :return: The mapping of identifiers to caller objects.
+    """
+
+    index = {}
+
+    for caller in callers:
+        try:
+            index.setdefault(caller.identifier, caller)
+
+        except TypeError:
+            continue
+
+    return index
+
+def validate_callers(callers: Iterable[Caller]) -> tuple[Caller, ...]:
+    """
+    Validates the caller objects and collects them into a tuple.
+
+    The type check is skipped when running with optimizations (python -O).
+
+    :param callers: The call objects for the functions.
+
+    :return: The validated caller objects.
+    """
+
+    callers = tuple(callers)
+
+    if __debug__ and not all(isinstance(c, Caller) for c in callers):
+        invalid = (c for c in callers if not isinstance(c, Caller))
+
+        raise ValueError(
+            f"All callers must be {Caller.__name__} objects, "
+            f"not: {', '.join(repr(caller) for caller in invalid)}"
+        )
+
+    return callers
 
 class CallDefinition:
     """A class to represent the call definition."""
@@ -222,12 +935,14 @@ class CallDefinition:
     CLEAN_BEFORE = True
     CLEAN_AFTER = False
     DYNAMIC = False
+    KIND = "thread"
+    MAX_WORKERS = None
 
     SLEEP = 0.0001
 
     __slots__ = (
         "wait", "reset_before", "reset_after", "sleep",
-        "clean_before", "clean_after", "dynamic"
+        "clean_before", "clean_after", "dynamic", "kind", "max_workers"
     )
 
     def __init__(
@@ -238,7 +953,9 @@ class CallDefinition:
             clean_before: bool = None,
             clean_after: bool = None,
             dynamic: bool = None,
-            sleep: int | float | dt.timedelta = None
+            sleep: int | float | dt.timedelta = None,
+            kind: Literal["thread", "process"] = None,
+            max_workers: int = None
     ) -> None:
         """
         Defines the class attributes.
@@ -248,10 +965,18 @@ class CallDefinition:
         :param reset_after: The value to reset after running.
         :param clean_before: The value to clean before running.
         :param clean_after: The value to clean after running.
-        :param dynamic: The value to enable dynamic sleep time.
-        :param sleep: The time for sleeping.
+        :param dynamic: Unused, kept for compatibility.
+        :param sleep: Unused, kept for compatibility.
+        :param kind: The kind of workers to run the calls in.
+        :param max_workers: The maximum amount of workers to run the calls in.
         """
 
+        if kind is None:
+            kind = self.KIND
+
+        if max_workers is None:
+            max_workers = self.MAX_WORKERS
+
         if wait is None:
             wait = self.WAIT
 
@@ -280,11 +1005,16 @@ class CallDefinition:
         self.clean_before = clean_before
         self.dynamic = dynamic
         self.sleep = sleep
+        self.kind = kind
+        self.max_workers = max_workers
 
 class CallsResults[R]:
     """A class to contain the info of a call to the results."""
 
-    __slots__ = ("_results", "_time", "_waiting", "_definition")
+    __slots__ = (
+        "_results", "_time", "_waiting", "_definition", "_errors",
+        "_callers", "_by_id", "_results_by_id"
+    )
 
     # noinspection PyShadowingNames
     def __init__(
@@ -292,19 +1022,50 @@ class CallsResults[R]:
             results: dict[Caller[R], CallResult[R]],
             time: ProcessTime,
             waiting: ProcessTime,
-            definition: CallDefinition
+            definition: CallDefinition,
+            errors: dict[Caller[R], BaseException] = None,
+            callers: tuple[Caller[R], ...] = None
     ) -> None:
 
-        self._results = results
+        if errors is None:
+            errors = {}
+
+        if callers is None:
+            callers = tuple(results)
+
+        self._results = MappingProxyType(results)
+        self._errors = errors
+        self._callers = callers
         self._time = time
         self._waiting = waiting
         self._definition = definition
 
+        self._by_id: dict[..., Caller[R]] | None = None
+        self._results_by_id: dict[..., CallResult[R]] | None = None
+
     @property
-    def results(self) -> dict[Caller[R], CallResult[R]]:
+    def results(self) -> Mapping[Caller[R], CallResult[R]]:
+        """
+        Returns the results of the callers.
+
+        The mapping is read-only, since the lookups by identifier
+        are indexed from it on first use.
+
+        :return: The read-only mapping of callers to their results.
+        """
 
         return self._results
 
+    @property
+    def errors(self) -> dict[Caller[R], BaseException]:
+
+        return self._errors
+
+    @property
+    def callers(self) -> tuple[Caller[R], ...]:
+
+        return self._callers
+
     @property
     def time(self) -> ProcessTime:
 
@@ -329,15 +1090,10 @@ class CallsResults[R]:
         :return: The matching caller object.
         """
 
-        for caller in self.results:
-            if caller.identifier == identifier:
-                return caller
+        if self._by_id is None:
+            self._by_id = find_callers_index(self.results)
 
-        raise ValueError(
-            f"Cannot find a caller object with the identifier: "
-            f"{identifier}. valid identifiers are: "
-            f"{', '.join(str(caller.identifier) for caller in self.results)}"
-        )
+        return find_caller(self.results, identifier, self._by_id)
 
     def result(self, identifier: ...) -> CallResult[R]:
         """
@@ -348,17 +1104,22 @@ class CallsResults[R]:
         :return: The matching caller object.
         """
 
-        for caller, result in self.results.items():
-            if caller.identifier == identifier:
-                return result
-            # end if
-        # end for
+        if self._results_by_id is None:
+            if self._by_id is None:
+                self._by_id = find_callers_index(self.results)
 
-        raise ValueError(
-            f"Cannot find a caller object with the identifier: "
-            f"{identifier}. valid identifiers are: "
-            f"{', '.join(str(caller.identifier) for caller in self.results)}"
-        )
+            self._results_by_id = {
+                key: self.results[caller]
+                for key, caller in self._by_id.items()
+            }
+
+        try:
+            return self._results_by_id[identifier]
+
+        except (KeyError, TypeError):
+            pass
+
+        return self.results[self.caller(identifier)]
 
 def await_completion(
         callers: Iterable[Caller], definition: CallDefinition
@@ -372,35 +1133,27 @@ def await_completion(
     :return: The waiting result.
     """
 
-    start = dt.datetime.now()
-
-    if isinstance(definition.sleep, dt.timedelta):
-        sleep = definition.sleep.total_seconds()
-
-    else:
-        sleep = definition.sleep
-
-    while True:
-        current = time.time()
+    start = _counter()
 
-        if not (
-            definition.wait and
-            not all(caller.complete for caller in callers)
-        ):
-            break
+    if definition.wait:
+        futures = []
+        pending = []
 
-        if definition.dynamic:
-            if isinstance(definition.sleep, dt.timedelta):
-                sleep = definition.sleep.total_seconds()
+        for caller in callers:
+            if caller.future is None:
+                pending.append(caller)
 
             else:
-                sleep = definition.sleep
+                futures.append(caller.future)
+
+        wait_futures(futures)
 
-        time.sleep(max((0, sleep - (time.time() - current))))
+        for caller in pending:
+            caller.wait()
 
-    end = dt.datetime.now()
+    end = _counter()
 
-    return ProcessTime(start=start, end=end)
+    return ProcessTime(start_ns=start, end_ns=end)
 
 def multi_threaded_defined_call[R](
         callers: Iterable[Caller[R]], definition: CallDefinition = None
@@ -414,38 +1167,77 @@ def multi_threaded_defined_call[R](
     :return: The call result.
     """
 
-    start = dt.datetime.now()
+    start = _counter()
+
+    callers = validate_callers(callers)
 
     if definition is None:
         definition = CallDefinition()
 
-    if definition.clean_before:
-        [caller.clean() for caller in callers]
+    if definition.kind == "thread":
+        executor = thread_pool(definition.max_workers)
+
+    elif definition.kind == "process":
+        _validate_picklable_targets(callers)
+
+        executor = process_pool(definition.max_workers)
+
+    else:
+        raise ValueError(
+            f"Invalid kind of workers: {definition.kind}. "
+            f"valid kinds are: thread, process"
+        )
+
+    clean = definition.clean_before
+    reset = definition.reset_before
+    inline = (
+        definition.wait and definition.kind == "thread" and len(callers) == 1
+    )
+
+    for caller in callers:
+        if clean:
+            caller.clean()
 
-    if definition.reset_before:
-        [caller.reset() for caller in callers]
+        if reset:
+            caller.reset()
 
-    [caller.start() for caller in callers]
+        if inline:
+            caller.run()
+
+        else:
+            caller.start(executor)
 
     waiting = await_completion(
         callers=callers, definition=definition
     )
 
-    results = {caller: caller.result for caller in callers}
+    clean = definition.clean_after
+    reset = definition.reset_after
+
+    results = {}
+    errors = {}
+
+    for caller in callers:
+        results[caller] = caller.result
+
+        if caller.error is not None:
+            errors[caller] = caller.error
 
-    if definition.reset_after:
-        [caller.reset() for caller in callers]
+        if reset:
+            caller.reset()
 
-    if definition.clean_after:
-        [caller.clean() for caller in callers]
+        if clean:
+            caller.clean()
 
-    end = dt.datetime.now()
+    end = _counter()
 
-    return CallsResults[R](
+    return CallsResults(
         results=results,
-        time=ProcessTime(start=start, end=end),
+        time=ProcessTime(start_ns=start, end_ns=end),
         definition=definition,
-        waiting=waiting
+        waiting=waiting,
+        errors=errors,
+        callers=callers
     )
 
 def multi_threaded_call[R](
@@ -456,7 +1248,9 @@ def multi_threaded_call[R](
         clean_before: bool = None,
         clean_after: bool = None,
         dynamic: bool = None,
-        sleep: int | float | dt.timedelta = None
+        sleep: int | float | dt.timedelta = None,
+        kind: Literal["thread", "process"] = None,
+        max_workers: int = None
 ) -> CallsResults[R]:
     """
     Calls the functions with the results.
@@ -467,8 +1261,10 @@ def multi_threaded_call[R](
     :param reset_after: The value to reset after running.
     :param clean_before: The value to clean before running.
     :param clean_after: The value to clean after running.
-    :param dynamic: The value to enable dynamic sleep time.
-    :param sleep: The time for sleeping.
+    :param dynamic: Unused, kept for compatibility.
+    :param sleep: Unused, kept for compatibility.
+    :param kind: The kind of workers to run the calls in.
+    :param max_workers: The maximum amount of workers to run the calls in.
 
     :return: The call result.
     """
@@ -479,6 +1275,7 @@ def multi_threaded_call[R](
             wait=wait, reset_after=reset_after,
             reset_before=reset_before, sleep=sleep,
             clean_before=clean_before, dynamic=dynamic,
-            clean_after=clean_after
+            clean_after=clean_after, kind=kind,
+            max_workers=max_workers
         )
     )
@@ -1,44 +1,116 @@
 # test.py
 
+import os
 import time
+import threading
+import asyncio
+from collections import deque
+from functools import partial
+from concurrent.futures import wait
+from typing import NamedTuple
 
-from multithreading import Caller, multi_threaded_call
+from multithreading import Caller, multi_threaded_call, thread_pool
 
-def slow_function(number: int, delay: float) -> dict[str, int | float]:
+class Result(NamedTuple):
 
-    for i in range(number):
-        time.sleep(delay)
+    number: int
+    delay: float
 
-    return dict(number=number, delay=delay)
+def slow_function(number: int, delay: float) -> Result:
+
+    time.sleep(number * delay)
+
+    return Result(number=number, delay=delay)
+
+async def async_slow_function(
+        number: int, delay: float
+) -> Result:
+
+    await asyncio.sleep(number * delay)
+
+    return Result(number=number, delay=delay)
+
+async def async_call(calls: int, number: int, delay: float) -> None:
+
+    await asyncio.gather(
+        *(async_slow_function(number, delay) for _ in range(calls))
+    )
 
 CALLS = 50
 DELAY = 0.01
 NUMBER = 100
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+def pool_workers() -> int:
+
+    return sum(
+        thread.name.startswith("Caller") for thread in threading.enumerate()
+    )
+
+def check_thread_pool() -> None:
+
+    pool = thread_pool()
+
+    wait([pool.submit(time.sleep, 0.05) for _ in range(CALLS)])
+
+    workers = pool_workers()
+
+    assert workers >= CALLS, workers
+
+    pool.submit(time.sleep, 0).result()
+
+    assert pool_workers() <= workers, "an idle worker was not reused"
+
+    for factor in (0.9, 1.0, 1.1):
+        time.sleep(pool.KEEP_ALIVE * factor)
+
+        pool.submit(time.sleep, 0).result(timeout=1)
+
+    time.sleep(pool.KEEP_ALIVE * 3)
+
+    assert pool_workers() == 0, "idle workers did not exit"
+
+    print("thread pool: ok")
 
 def main() -> None:
 
-    callers = [
-        Caller[dict[str, int | float]](
-            target=slow_function,
-            kwargs=dict(delay=DELAY, number=NUMBER)
-        ) for _ in range(CALLS)
-    ]
+    check_thread_pool()
 
-    s = time.time()
+    target = partial(slow_function, delay=DELAY, number=NUMBER)
+
+    callers = [Caller[Result](target=target) for _ in range(CALLS)]
+
+    s = time.perf_counter()
 
     multi_threaded_call(callers)
 
-    e = time.time()
+    e = time.perf_counter()
+
+    print("multi-threading:", e - s)
+
+    s = e
+
+    multi_threaded_call(callers, max_workers=MAX_WORKERS)
+
+    e = time.perf_counter()
+
+    print("multi-threading (bounded):", e - s)
+
+    s = e
+
+    asyncio.run(async_call(CALLS, NUMBER, DELAY))
+
+    e = time.perf_counter()
 
-    print(e - s)
+    print("asyncio:", e - s)
 
     s = e
 
-    all(slow_function(*caller.args, **caller.kwargs) for caller in callers)
+    deque((caller.target() for caller in callers), maxlen=0)
 
-    e = time.time()
+    e = time.perf_counter()
 
-    print(e - s)
+    print("single-threading:", e - s)
 
 if __name__ == '__main__':
     main()